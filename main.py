@@ -10,32 +10,74 @@ information into JSON files. The engine has no knowledge of any hidden strategy
 library (which is only used later during scoring).
 """
 
-import random
-import uuid
+import itertools
 import math
 import json
-from typing import List, Dict, Any, Optional
+import sys
+from typing import List, Dict, Any, Optional, BinaryIO, Iterator
+
+import numpy as np
+
+try:
+    import orjson
+except ImportError:  # Fall back to the stdlib encoder.
+    orjson = None
+
+
+def _dumps(obj: Any) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, separators=(",", ":")).encode("utf-8")
 
 ###############################################################################
 #                           STATUS EFFECTS CLASS
 ###############################################################################
 
+def _effect_damage(character: 'Character', value: int) -> None:
+    character.take_damage(value)
+
+
+def _effect_heal(character: 'Character', value: int) -> None:
+    character.heal(value)
+
+
+def _effect_buff(character: 'Character', value: int) -> None:
+    character.attack += value
+
+
+def _effect_debuff(character: 'Character', value: int) -> None:
+    character.defense = max(0, character.defense - value)
+
+
+def _effect_none(character: 'Character', value: int) -> None:
+    pass
+
+
+# Effect handlers, resolved once per StatusEffect/Item instead of on every use.
+_STATUS_EFFECT_HANDLERS = {
+    "poison": _effect_damage,
+    "heal": _effect_heal,
+    "buff": _effect_buff,
+    "debuff": _effect_debuff,
+}
+_ITEM_EFFECT_HANDLERS = {
+    "heal": _effect_heal,
+    "damage": _effect_damage,
+    "buff": _effect_buff,
+}
+
 class StatusEffect:
+    __slots__ = ('name', 'duration', 'effect_value', 'effect_type', '_apply')
+
     def __init__(self, name: str, duration: int, effect_value: int, effect_type: str):
         self.name = name
         self.duration = duration
         self.effect_value = effect_value
         self.effect_type = effect_type
+        self._apply = _STATUS_EFFECT_HANDLERS.get(effect_type, _effect_none)
 
     def apply_effect(self, character: 'Character') -> None:
-        if self.effect_type == "poison":
-            character.take_damage(self.effect_value)
-        elif self.effect_type == "heal":
-            character.heal(self.effect_value)
-        elif self.effect_type == "buff":
-            character.attack += self.effect_value
-        elif self.effect_type == "debuff":
-            character.defense = max(0, character.defense - self.effect_value)
+        self._apply(character, self.effect_value)
 
     def tick(self) -> None:
         self.duration -= 1
@@ -51,6 +93,8 @@ class StatusEffect:
 ###############################################################################
 
 class Ability:
+    __slots__ = ('name', 'power', 'cooldown', 'current_cooldown', 'effect')
+
     def __init__(self, name: str, power: int, cooldown: int, effect: Optional[StatusEffect] = None):
         self.name = name
         self.power = power
@@ -76,19 +120,17 @@ class Ability:
 ###############################################################################
 
 class Item:
+    __slots__ = ('name', 'effect', 'effect_value', 'quantity', '_apply')
+
     def __init__(self, name: str, effect: str, effect_value: int, quantity: int = 1):
         self.name = name
         self.effect = effect
         self.effect_value = effect_value
         self.quantity = quantity
+        self._apply = _ITEM_EFFECT_HANDLERS.get(effect, _effect_none)
 
     def use_item(self, character: 'Character') -> None:
-        if self.effect == "heal":
-            character.heal(self.effect_value)
-        elif self.effect == "damage":
-            character.take_damage(self.effect_value)
-        elif self.effect == "buff":
-            character.attack += self.effect_value
+        self._apply(character, self.effect_value)
         self.quantity -= 1
 
     def __repr__(self) -> str:
@@ -99,46 +141,120 @@ class Item:
 ###############################################################################
 
 class Character:
+    # The SoA view fields come first so they share the start of the instance.
+    __slots__ = ('_idx', '_hp', '_atk', '_def', '_spd', '_alive', '_pos',
+                 'max_hp', 'name', 'team_id', 'abilities', 'inventory', 'status_effects')
+
     def __init__(self, name: str, hp: int, attack: int, defense: int, speed: int,
                  team_id: str, position: int, abilities: Optional[List[Ability]] = None,
                  inventory: Optional[List[Item]] = None):
         self.name = name
         self.max_hp = hp
-        self.current_hp = hp
-        self.attack = attack
-        self.defense = defense
-        self.speed = speed
         self.team_id = team_id
-        self.position = position
-        self.alive = True
         self.abilities = abilities if abilities is not None else []
         self.inventory = inventory if inventory is not None else []
         self.status_effects: List[StatusEffect] = []
+        # Combat stats live in SoA columns indexed by _idx. Until a GameEngine
+        # binds this character to its shared columns it owns one-slot arrays.
+        self._idx = 0
+        self._hp = np.array([hp], dtype=np.int32)
+        self._atk = np.array([attack], dtype=np.int32)
+        self._def = np.array([defense], dtype=np.int32)
+        self._spd = np.array([speed], dtype=np.int32)
+        self._pos = np.array([position], dtype=np.int32)
+        self._alive = np.array([True], dtype=bool)
+
+    def _bind(self, engine: 'GameEngine', idx: int) -> None:
+        self._idx = idx
+        self._hp = engine._hp
+        self._atk = engine._atk
+        self._def = engine._def
+        self._spd = engine._spd
+        self._pos = engine._pos
+        self._alive = engine._alive
+
+    @property
+    def current_hp(self) -> int:
+        return int(self._hp[self._idx])
+
+    @current_hp.setter
+    def current_hp(self, value: int) -> None:
+        self._hp[self._idx] = value
+
+    @property
+    def attack(self) -> int:
+        return int(self._atk[self._idx])
+
+    @attack.setter
+    def attack(self, value: int) -> None:
+        self._atk[self._idx] = value
+
+    @property
+    def defense(self) -> int:
+        return int(self._def[self._idx])
+
+    @defense.setter
+    def defense(self, value: int) -> None:
+        self._def[self._idx] = value
+
+    @property
+    def speed(self) -> int:
+        return int(self._spd[self._idx])
+
+    @speed.setter
+    def speed(self, value: int) -> None:
+        self._spd[self._idx] = value
+
+    @property
+    def position(self) -> int:
+        return int(self._pos[self._idx])
+
+    @position.setter
+    def position(self, value: int) -> None:
+        self._pos[self._idx] = value
+
+    @property
+    def alive(self) -> bool:
+        return bool(self._alive[self._idx])
+
+    @alive.setter
+    def alive(self, value: bool) -> None:
+        self._alive[self._idx] = value
 
     def is_alive(self) -> bool:
-        return self.alive
+        return bool(self._alive[self._idx])
 
     def take_damage(self, amount: int) -> None:
-        self.current_hp -= amount
-        if self.current_hp <= 0:
-            self.current_hp = 0
-            self.alive = False
+        i = self._idx
+        hp = int(self._hp[i]) - amount
+        if hp <= 0:
+            self._hp[i] = 0
+            self._alive[i] = False
+        else:
+            self._hp[i] = hp
 
     def heal(self, amount: int) -> None:
-        self.current_hp = min(self.current_hp + amount, self.max_hp)
-        if self.current_hp > 0:
-            self.alive = True
+        i = self._idx
+        hp = min(int(self._hp[i]) + amount, self.max_hp)
+        self._hp[i] = hp
+        if hp > 0:
+            self._alive[i] = True
 
     def add_status_effect(self, effect: StatusEffect) -> None:
         self.status_effects.append(effect)
 
     def process_status_effects(self) -> List[str]:
         logs = []
+        expired = False
         for effect in self.status_effects:
             effect.apply_effect(self)
             logs.append(f"{self.name} is affected by {effect.name} ({effect.effect_value})")
-            effect.tick()
-        self.status_effects = [e for e in self.status_effects if not e.is_expired()]
+            effect.duration -= 1
+            if effect.duration <= 0:
+                expired = True
+        # Only rebuild the list on turns where something actually ran out.
+        if expired:
+            self.status_effects = [e for e in self.status_effects if e.duration > 0]
         return logs
 
     def tick_abilities(self) -> None:
@@ -157,6 +273,13 @@ class Team:
         self.team_id = team_id
         self.characters: List[Character] = []
         self.formation: List[int] = []
+        # Set by GameEngine once the team's characters share its SoA columns.
+        self._alive: Optional[np.ndarray] = None
+        self._mask: Optional[np.ndarray] = None
+
+    def _bind(self, engine: 'GameEngine', team_code: int) -> None:
+        self._alive = engine._alive
+        self._mask = engine._team == team_code
 
     def add_character(self, character: Character) -> None:
         self.characters.append(character)
@@ -166,7 +289,9 @@ class Team:
         return [c for c in self.characters if c.is_alive()]
 
     def is_defeated(self) -> bool:
-        return all(not c.is_alive() for c in self.characters)
+        if self._mask is None:
+            return all(not c.is_alive() for c in self.characters)
+        return not self._alive[self._mask].any()
 
     def rearrange_formation(self, new_order: List[int]) -> None:
         if len(new_order) != len(self.characters):
@@ -183,8 +308,12 @@ class Team:
 ###############################################################################
 
 class Event:
+    __slots__ = ('event_id', 'description')
+    # Sequential ids are enough to tell events apart within a run.
+    _next_id = itertools.count()
+
     def __init__(self, description: str):
-        self.event_id = uuid.uuid4().hex
+        self.event_id = next(Event._next_id)
         self.description = description
 
     def process(self, game_engine: 'GameEngine') -> None:
@@ -194,6 +323,8 @@ class Event:
         return f"<Event {self.event_id}: {self.description}>"
 
 class CriticalHitEvent(Event):
+    __slots__ = ('attacker', 'target', 'extra_damage')
+
     def __init__(self, attacker: Character, target: Character, extra_damage: int):
         super().__init__(f"Critical hit by {attacker.name} on {target.name} for extra {extra_damage}")
         self.attacker = attacker
@@ -204,6 +335,8 @@ class CriticalHitEvent(Event):
         self.target.take_damage(self.extra_damage)
 
 class MissEvent(Event):
+    __slots__ = ('attacker', 'target')
+
     def __init__(self, attacker: Character, target: Character):
         super().__init__(f"{attacker.name}'s attack missed {target.name}")
         self.attacker = attacker
@@ -213,6 +346,8 @@ class MissEvent(Event):
         pass
 
 class AbilityUsedEvent(Event):
+    __slots__ = ('user', 'ability', 'target')
+
     def __init__(self, user: Character, ability: Ability, target: Optional[Character]):
         super().__init__(f"{user.name} used ability {ability.name} on {target.name if target else 'None'}")
         self.user = user
@@ -223,106 +358,449 @@ class AbilityUsedEvent(Event):
         if self.ability.effect and self.target:
             self.target.add_status_effect(self.ability.effect)
 
+###############################################################################
+#                       BATTLE SIMULATION KERNEL
+###############################################################################
+
+try:
+    import numba
+except ImportError:  # Numba is optional; the kernel also runs as plain Python.
+    numba = None
+
+
+def _njit(func):
+    if numba is None:
+        return func
+    return numba.njit(cache=True)(func)
+
+# Codes written into the kernel's record buffers.
+_ACTION_IDLE = 0
+_ACTION_ATTACK = 1
+_ACTION_MISS = 2
+_ACTION_ABILITY = 3
+_ACTION_STRINGS = {_ACTION_IDLE: "idle", _ACTION_ATTACK: "attack", _ACTION_MISS: "attack (missed)"}
+
+_EVENT_CRITICAL = 0
+_EVENT_MISS = 1
+_EVENT_ABILITY = 2
+
+_EFFECT_POISON = 0
+_EFFECT_HEAL = 1
+_EFFECT_BUFF = 2
+_EFFECT_DEBUFF = 3
+_EFFECT_CODES = {"poison": _EFFECT_POISON, "heal": _EFFECT_HEAL,
+                 "buff": _EFFECT_BUFF, "debuff": _EFFECT_DEBUFF}
+
+# Record layouts of the kernel's output buffers. Characters, abilities and
+# effects are referenced by index; -1 means no target. An event's value is the
+# extra damage of a critical hit or the ability that was used.
+_ACTION_RECORD = np.dtype([("turn", np.int32), ("actor", np.int16), ("action", np.int8),
+                           ("target", np.int16), ("damage", np.int32), ("ability", np.int16)])
+_EVENT_RECORD = np.dtype([("turn", np.int32), ("event", np.int8), ("actor", np.int16),
+                          ("target", np.int16), ("value", np.int32)])
+_STATUS_RECORD = np.dtype([("turn", np.int32), ("character", np.int16), ("effect", np.int16)])
+
+
+@_njit
+def _take_damage(hp, alive, idx, amount):
+    """Apply damage and return True if it killed a living character."""
+    remaining = hp[idx] - amount
+    if remaining <= 0:
+        hp[idx] = 0
+        killed = alive[idx]
+        alive[idx] = False
+        return killed
+    hp[idx] = remaining
+    return False
+
+
+@_njit
+def _heal(hp, alive, max_hp, idx, amount):
+    healed = min(hp[idx] + amount, max_hp[idx])
+    hp[idx] = healed
+    if healed > 0:
+        alive[idx] = True
+
+
+@_njit
+def _apply_effect(code, value, idx, hp, atk, def_, alive, max_hp):
+    if code == _EFFECT_POISON:
+        _take_damage(hp, alive, idx, value)
+    elif code == _EFFECT_HEAL:
+        _heal(hp, alive, max_hp, idx, value)
+    elif code == _EFFECT_BUFF:
+        atk[idx] += value
+    elif code == _EFFECT_DEBUFF:
+        def_[idx] = max(0, def_[idx] - value)
+
+
+@_njit
+def _choose_target(living, team_alive, enemy, roll):
+    n_alive = team_alive[enemy]
+    if n_alive == 0:
+        return -1
+    return living[enemy, int(roll * n_alive)]
+
+
+@_njit
+def _drop_living(living, team_alive, code, idx):
+    """Remove a fallen character from its team's living list, keeping order."""
+    n_alive = team_alive[code]
+    j = 0
+    while living[code, j] != idx:
+        j += 1
+    while j < n_alive - 1:
+        living[code, j] = living[code, j + 1]
+        j += 1
+    team_alive[code] = n_alive - 1
+
+
+@_njit
+def _log_event(events, n_events, turn, code, actor, target, value):
+    record = events[n_events]
+    record["turn"] = turn
+    record["event"] = code
+    record["actor"] = actor
+    record["target"] = target
+    record["value"] = value
+    return n_events + 1
+
+
+@_njit
+def _simulate(hp, atk, def_, spd, pos, alive, team, max_hp,
+              slot_start, slot_ability, ab_power, ab_cooldown, ab_left, ab_effect,
+              fx_code, fx_value, fx_left, active_owner, active_fx, n_active,
+              turn, max_turns, rng, actions, events, status):
+    """Run turns until one team falls or max_turns is reached.
+
+    Mutates the state arrays in place and fills the record buffers. Returns
+    (last turn, last logged turn, battle over, #actions, #events, #status, #active).
+    """
+    n_actions = 0
+    n_events = 0
+    n_status = 0
+    logged = turn
+    over = False
+    # Nothing changes speed or position mid-battle, so the turn order is sorted
+    # once: fastest first, ties broken by formation position (both sorts stable).
+    turn_order = np.argsort(pos, kind="mergesort")
+    turn_order = turn_order[np.argsort(-spd[turn_order], kind="mergesort")]
+    while not over and turn < max_turns:
+        turn += 1
+        status_mark = n_status
+        # Living characters are gathered once per turn. Each applies its status
+        # effects in the order they were added, then drops the ones that ran out.
+        alive_idx = np.flatnonzero(alive)
+        for c in alive_idx:
+            for e in range(n_active):
+                if active_owner[e] == c:
+                    fx = active_fx[e]
+                    _apply_effect(fx_code[fx], fx_value[fx], c, hp, atk, def_, alive, max_hp)
+                    record = status[n_status]
+                    record["turn"] = turn
+                    record["character"] = c
+                    record["effect"] = fx
+                    n_status += 1
+                    fx_left[fx] -= 1
+            kept = 0
+            for e in range(n_active):
+                if active_owner[e] != c or fx_left[active_fx[e]] > 0:
+                    active_owner[kept] = active_owner[e]
+                    active_fx[kept] = active_fx[e]
+                    kept += 1
+            n_active = kept
+
+        # Drop anyone the status effects just killed.
+        alive_idx = alive_idx[alive[alive_idx]]
+        if alive_idx.size == 0:
+            # Nobody is left to act, so this turn is never logged.
+            n_status = status_mark
+            over = True
+            break
+        # Living members of each team in roster order, kept current as
+        # fighters fall this turn so targets are picked by index.
+        living = np.empty((2, alive_idx.size), dtype=np.int32)
+        team_alive = np.zeros(2, dtype=np.int32)
+        for c in alive_idx:
+            living[team[c], team_alive[team[c]]] = c
+            team_alive[team[c]] += 1
+        order = turn_order[alive[turn_order]]
+        # Per-fighter rolls for the whole turn: miss, critical, use an ability,
+        # which ability, which target. Picks scale a roll by the choice count.
+        rolls = rng.random((order.size, 5))
+        crit_damage = atk[order] // 2
+
+        turn_events = n_events
+        for k in range(order.size):
+            fighter = order[k]
+            if not alive[fighter]:
+                continue
+            first_slot = slot_start[fighter]
+            last_slot = slot_start[fighter + 1]
+            n_available = 0
+            for s in range(first_slot, last_slot):
+                ab = slot_ability[s]
+                if ab_left[ab] > 0:
+                    ab_left[ab] -= 1
+            for s in range(first_slot, last_slot):
+                if ab_left[slot_ability[s]] == 0:
+                    n_available += 1
+
+            enemy = 1 - team[fighter]
+            code = _ACTION_IDLE
+            target = -1
+            damage = 0
+            ability = -1
+            if n_available > 0 and rolls[k, 2] < 0.3:
+                pick = int(rolls[k, 3] * n_available)
+                for s in range(first_slot, last_slot):
+                    if ab_left[slot_ability[s]] == 0:
+                        if pick == 0:
+                            ability = slot_ability[s]
+                            break
+                        pick -= 1
+                target = _choose_target(living, team_alive, enemy, rolls[k, 4])
+                if target >= 0:
+                    ab_left[ability] = ab_cooldown[ability]
+                    n_events = _log_event(events, n_events, turn, _EVENT_ABILITY, fighter, target, ability)
+                    damage = atk[fighter] + ab_power[ability] - def_[target]
+                    if damage < 1:
+                        damage = 1
+                    if _take_damage(hp, alive, target, damage):
+                        _drop_living(living, team_alive, enemy, target)
+                    code = _ACTION_ABILITY
+            else:
+                target = _choose_target(living, team_alive, enemy, rolls[k, 4])
+                if target >= 0:
+                    if rolls[k, 0] < 0.1:
+                        n_events = _log_event(events, n_events, turn, _EVENT_MISS, fighter, target, 0)
+                        code = _ACTION_MISS
+                    else:
+                        extra_damage = 0
+                        if rolls[k, 1] < 0.2:
+                            extra_damage = crit_damage[k]
+                            n_events = _log_event(events, n_events, turn, _EVENT_CRITICAL,
+                                                  fighter, target, extra_damage)
+                        damage = atk[fighter] - def_[target]
+                        if damage < 1:
+                            damage = 1
+                        damage += extra_damage
+                        if _take_damage(hp, alive, target, damage):
+                            _drop_living(living, team_alive, enemy, target)
+                        code = _ACTION_ATTACK
+
+            record = actions[n_actions]
+            record["turn"] = turn
+            record["actor"] = fighter
+            record["action"] = code
+            record["target"] = target
+            record["damage"] = damage
+            record["ability"] = ability
+            n_actions += 1
+            if team_alive[0] == 0 or team_alive[1] == 0:
+                over = True
+                break
+        logged = turn
+
+        # Resolve the turn's events: critical hits land their extra damage
+        # again and abilities attach their status effect to the target.
+        for e in range(turn_events, n_events):
+            record = events[e]
+            if record["event"] == _EVENT_CRITICAL:
+                _take_damage(hp, alive, record["target"], record["value"])
+            elif record["event"] == _EVENT_ABILITY:
+                fx = ab_effect[record["value"]]
+                if fx >= 0:
+                    active_owner[n_active] = record["target"]
+                    active_fx[n_active] = fx
+                    n_active += 1
+    return turn, logged, over, n_actions, n_events, n_status, n_active
+
 ###############################################################################
 #                        GAME ENGINE CLASS
 ###############################################################################
 
 class GameEngine:
-    def __init__(self, team_a: Team, team_b: Team, random_seed: Optional[int] = None):
+    def __init__(self, team_a: Team, team_b: Team, random_seed: Optional[int] = None,
+                 log_path: Optional[str] = None):
         self.team_a = team_a
         self.team_b = team_b
         self.turn_log: List[Dict[str, Any]] = []
-        self.event_log: List[Event] = []
+        # When set, run_battle streams each log entry to this file as a JSON array.
+        self.log_path = log_path
+        self._log_fp: Optional[BinaryIO] = None
         self.battle_over = False
         self.turn_count = 0
-        if random_seed is not None:
-            random.seed(random_seed)
+        self._build_state()
+        self._rng = np.random.default_rng(random_seed)
+
+    def _build_state(self) -> None:
+        # Struct-of-arrays combat state, one slot per character. Characters and
+        # teams are rebound as thin views over these columns.
+        self._characters: List[Character] = self.team_a.characters + self.team_b.characters
+        fighters = self._characters
+        self._names = [c.name for c in fighters]
+        self._hp = np.array([c.current_hp for c in fighters], dtype=np.int32)
+        self._atk = np.array([c.attack for c in fighters], dtype=np.int32)
+        self._def = np.array([c.defense for c in fighters], dtype=np.int32)
+        self._spd = np.array([c.speed for c in fighters], dtype=np.int32)
+        self._pos = np.array([c.position for c in fighters], dtype=np.int32)
+        self._alive = np.array([c.is_alive() for c in fighters], dtype=bool)
+        self._max_hp = np.array([c.max_hp for c in fighters], dtype=np.int32)
+        self._team = np.array([0] * len(self.team_a.characters) + [1] * len(self.team_b.characters),
+                              dtype=np.uint8)
+        for idx, character in enumerate(fighters):
+            character._bind(self, idx)
+        self.team_a._bind(self, 0)
+        self.team_b._bind(self, 1)
+
+        # Abilities and status effects are shared between characters, so their
+        # cooldowns and durations are stored once per object. Each character's
+        # abilities are the slots slot_start[i]:slot_start[i + 1].
+        self._abilities: List[Ability] = []
+        self._effects: List[StatusEffect] = []
+        ability_ids: Dict[int, int] = {}
+        slot_start = [0]
+        slot_ability = []
+        for character in fighters:
+            for ability in character.abilities:
+                if id(ability) not in ability_ids:
+                    ability_ids[id(ability)] = len(self._abilities)
+                    self._abilities.append(ability)
+                slot_ability.append(ability_ids[id(ability)])
+            slot_start.append(len(slot_ability))
+        self._slot_start = np.array(slot_start, dtype=np.int32)
+        self._slot_ability = np.array(slot_ability, dtype=np.int32)
+        self._ab_power = np.array([ab.power for ab in self._abilities], dtype=np.int32)
+        self._ab_cooldown = np.array([ab.cooldown for ab in self._abilities], dtype=np.int32)
+        self._ab_left = np.array([ab.current_cooldown for ab in self._abilities], dtype=np.int32)
+
+        effect_ids: Dict[int, int] = {}
+
+        def effect_index(effect: StatusEffect) -> int:
+            if id(effect) not in effect_ids:
+                effect_ids[id(effect)] = len(self._effects)
+                self._effects.append(effect)
+            return effect_ids[id(effect)]
+
+        self._ab_effect = np.array([effect_index(ab.effect) if ab.effect else -1 for ab in self._abilities],
+                                   dtype=np.int32)
+        self._active = [(idx, effect_index(effect))
+                        for idx, character in enumerate(fighters) for effect in character.status_effects]
+        self._fx_code = np.array([_EFFECT_CODES.get(fx.effect_type, -1) for fx in self._effects], dtype=np.int32)
+        self._fx_value = np.array([fx.effect_value for fx in self._effects], dtype=np.int32)
+        self._fx_left = np.array([fx.duration for fx in self._effects], dtype=np.int32)
 
     def run_battle(self) -> None:
+        if self.log_path is None:
+            self._run_battle()
+            return
+        with open(self.log_path, "wb") as fp:
+            fp.write(b"[")
+            self._log_fp = fp
+            try:
+                self._run_battle()
+            finally:
+                self._log_fp = None
+            fp.write(b"\n]\n")
+
+    def _run_battle(self) -> None:
         max_turns = 100
-        while not self.battle_over and self.turn_count < max_turns:
-            self.turn_count += 1
-            turn_details = {"turn_number": self.turn_count, "actions": []}
-            status_logs = self._process_status_effects()
-            if status_logs:
-                turn_details["status_effects"] = status_logs
-            all_fighters = self._get_all_alive_characters()
-            if not all_fighters:
-                self.battle_over = True
-                break
-            all_fighters.sort(key=lambda c: (-c.speed, c.position))
-            for fighter in all_fighters:
-                if not fighter.is_alive():
-                    continue
-                fighter.tick_abilities()
-                action_detail = self._perform_action(fighter)
-                turn_details["actions"].append(action_detail)
-                if self.team_a.is_defeated() or self.team_b.is_defeated():
-                    self.battle_over = True
-                    break
-            self.turn_log.append(turn_details)
-            self._process_events()
+        if not self.battle_over:
+            n = len(self._characters)
+            # Every action can attach at most one effect, and an attached effect
+            # is applied at most `longest` times before it expires.
+            capacity = len(self._active) + max_turns * n
+            longest = max([1] + [fx.duration for fx in self._effects])
+            active_owner = np.zeros(capacity, dtype=np.int32)
+            active_fx = np.zeros(capacity, dtype=np.int32)
+            for e, (owner, fx) in enumerate(self._active):
+                active_owner[e] = owner
+                active_fx[e] = fx
+            actions = np.zeros(max_turns * n, dtype=_ACTION_RECORD)
+            events = np.zeros(max_turns * n, dtype=_EVENT_RECORD)
+            status = np.zeros(capacity * longest, dtype=_STATUS_RECORD)
+            first_turn = self.turn_count
+            (self.turn_count, logged, self.battle_over,
+             n_actions, n_events, n_status, n_active) = _simulate(
+                self._hp, self._atk, self._def, self._spd, self._pos, self._alive, self._team, self._max_hp,
+                self._slot_start, self._slot_ability, self._ab_power, self._ab_cooldown, self._ab_left,
+                self._ab_effect, self._fx_code, self._fx_value, self._fx_left,
+                active_owner, active_fx, len(self._active),
+                first_turn, max_turns, self._rng, actions, events, status)
+            self._active = list(zip(active_owner[:n_active].tolist(), active_fx[:n_active].tolist()))
+            self._sync_objects()
+            for turn_details in self._iter_turn_log(first_turn, logged, actions[:n_actions].tolist(),
+                                                    events[:n_events].tolist(), status[:n_status].tolist()):
+                self._record(turn_details)
         self._log_battle_result()
 
-    def _get_all_alive_characters(self) -> List[Character]:
-        return self.team_a.get_alive_characters() + self.team_b.get_alive_characters()
-
-    def _process_status_effects(self) -> List[str]:
-        logs = []
-        for character in self._get_all_alive_characters():
-            logs.extend(character.process_status_effects())
-        return logs
-
-    def _perform_action(self, fighter: Character) -> Dict[str, Any]:
-        action_detail = {"actor": fighter.name, "action": None, "target": None, "damage": 0, "extra": []}
-        available_abilities = [ab for ab in fighter.abilities if ab.is_available()]
-        if available_abilities and random.random() < 0.3:
-            ability = random.choice(available_abilities)
-            target = self._choose_target(fighter)
-            if target:
-                ability.use()
-                self.event_log.append(AbilityUsedEvent(fighter, ability, target))
-                damage = max(1, fighter.attack + ability.power - target.defense)
-                target.take_damage(damage)
-                action_detail["action"] = f"use ability {ability.name}"
-                action_detail["target"] = target.name
-                action_detail["damage"] = damage
-                action_detail["extra"].append("ability event logged")
-            else:
-                action_detail["action"] = "idle"
-        else:
-            target = self._choose_target(fighter)
-            if target:
-                if random.random() < 0.1:
-                    self.event_log.append(MissEvent(fighter, target))
-                    action_detail["action"] = "attack (missed)"
-                    action_detail["target"] = target.name
-                    action_detail["damage"] = 0
+    def _record(self, entry: Dict[str, Any]) -> None:
+        if self._log_fp is not None:
+            self._log_fp.write(b"\n" if self._log_fp.tell() == 1 else b",\n")
+            self._log_fp.write(_dumps(entry))
+        self.turn_log.append(entry)
+
+    def _sync_objects(self) -> None:
+        # Copy cooldowns, durations and attached effects back onto the objects.
+        for ability, left in zip(self._abilities, self._ab_left.tolist()):
+            ability.current_cooldown = left
+        for effect, left in zip(self._effects, self._fx_left.tolist()):
+            effect.duration = left
+        for character in self._characters:
+            character.status_effects = []
+        for owner, fx in self._active:
+            self._characters[owner].status_effects.append(self._effects[fx])
+
+    def _iter_turn_log(self, first_turn: int, last_turn: int, actions: List[List[int]],
+                       events: List[List[int]], status: List[List[int]]) -> Iterator[Dict[str, Any]]:
+        characters = self._characters
+        names = self._names
+        abilities = self._abilities
+        ability_actions = [f"use ability {ability.name}" for ability in abilities]
+        effects = self._effects
+        n_actions, n_events, n_status = len(actions), len(events), len(status)
+        a = e = s = 0
+        for turn in range(first_turn + 1, last_turn + 1):
+            # The turn's lists are built locally and looked up once, not per record.
+            turn_actions = []
+            turn_details = {"turn_number": turn, "actions": turn_actions}
+            status_logs = []
+            while s < n_status and status[s][0] == turn:
+                _, owner, fx = status[s]
+                status_logs.append(f"{names[owner]} is affected by {effects[fx].name} "
+                                   f"({effects[fx].effect_value})")
+                s += 1
+            if status_logs:
+                turn_details["status_effects"] = status_logs
+            while a < n_actions and actions[a][0] == turn:
+                _, actor, code, target, damage, ability = actions[a]
+                if code == _ACTION_IDLE:
+                    action_detail = {"actor": names[actor], "action": _ACTION_STRINGS[code], "target": None,
+                                     "damage": 0, "extra": []}
+                elif code == _ACTION_ABILITY:
+                    action_detail = {"actor": names[actor], "action": ability_actions[ability],
+                                     "target": names[target], "damage": damage,
+                                     "extra": ["ability event logged"]}
                 else:
-                    extra_damage = 0
-                    if random.random() < 0.2:
-                        extra_damage = int(fighter.attack * 0.5)
-                        self.event_log.append(CriticalHitEvent(fighter, target, extra_damage))
-                    base_damage = max(1, fighter.attack - target.defense)
-                    total_damage = base_damage + extra_damage
-                    target.take_damage(total_damage)
-                    action_detail["action"] = "attack"
-                    action_detail["target"] = target.name
-                    action_detail["damage"] = total_damage
-            else:
-                action_detail["action"] = "idle"
-        return action_detail
-
-    def _choose_target(self, fighter: Character) -> Optional[Character]:
-        target_team = self.team_b if fighter.team_id == self.team_a.team_id else self.team_a
-        living_enemies = target_team.get_alive_characters()
-        return random.choice(living_enemies) if living_enemies else None
-
-    def _process_events(self) -> None:
-        while self.event_log:
-            event = self.event_log.pop(0)
-            event.process(self)
-            self.turn_log[-1].setdefault("events", []).append(str(event))
+                    action_detail = {"actor": names[actor], "action": _ACTION_STRINGS[code],
+                                     "target": names[target], "damage": damage, "extra": []}
+                turn_actions.append(action_detail)
+                a += 1
+            turn_events = []
+            while e < n_events and events[e][0] == turn:
+                _, code, actor, target, value = events[e]
+                if code == _EVENT_CRITICAL:
+                    event = CriticalHitEvent(characters[actor], characters[target], value)
+                elif code == _EVENT_MISS:
+                    event = MissEvent(characters[actor], characters[target])
+                else:
+                    event = AbilityUsedEvent(characters[actor], abilities[value], characters[target])
+                turn_events.append(str(event))
+                e += 1
+            if turn_events:
+                turn_details["events"] = turn_events
+            yield turn_details
 
     def _log_battle_result(self) -> None:
         if self.team_a.is_defeated() and self.team_b.is_defeated():
@@ -333,7 +811,7 @@ class GameEngine:
             result = f"Team {self.team_a.team_id} wins!"
         else:
             result = "Turn limit reached. Possibly a draw."
-        self.turn_log.append({"battle_result": result, "final_turn": self.turn_count})
+        self._record({"battle_result": result, "final_turn": self.turn_count})
 
     def get_confrontation_log(self) -> List[Dict[str, Any]]:
         return self.turn_log
@@ -347,26 +825,30 @@ class BattleReplay:
         self.log = log
 
     def display_replay(self) -> None:
+        # Build the whole replay first and write it in one call rather than
+        # paying for a print() per line.
+        out = []
         for entry in self.log:
             if "turn_number" in entry:
-                print(f"--- Turn {entry['turn_number']} ---")
+                out.append(f"--- Turn {entry['turn_number']} ---")
                 if "status_effects" in entry:
-                    for effect in entry["status_effects"]:
-                        print(effect)
+                    out.extend(entry["status_effects"])
                 for action in entry.get("actions", []):
-                    print(f"{action['actor']} performed {action['action']} on {action.get('target', 'N/A')} causing {action['damage']} damage")
+                    out.append(f"{action['actor']} performed {action['action']} on {action.get('target', 'N/A')} causing {action['damage']} damage")
                 if "events" in entry:
                     for ev in entry["events"]:
-                        print(f"Event: {ev}")
+                        out.append(f"Event: {ev}")
             elif "battle_result" in entry:
-                print(f"Battle Result: {entry['battle_result']} after {entry.get('final_turn', 'unknown')} turns")
-            print("\n")
+                out.append(f"Battle Result: {entry['battle_result']} after {entry.get('final_turn', 'unknown')} turns")
+            out.append("\n")
+        if out:
+            sys.stdout.write("\n".join(out) + "\n")
 
 ###############################################################################
 #                           MAIN GAME EXAMPLE
 ###############################################################################
 
-def main_example() -> None:
+def main_example(show_replay: bool = True) -> None:
     # Create teams and set up lineups
     # Create teams
     team_a = Team("Team_A")
@@ -435,27 +917,24 @@ def main_example() -> None:
     team_a.rearrange_formation([0, 1, 2, 3])
     team_b.rearrange_formation([0, 1, 2, 3])
 
-    # Run the battle simulation
-    engine = GameEngine(team_a, team_b, random_seed=12345)
+    # Run the battle simulation, streaming the battle log to JSON for scoring
+    engine = GameEngine(team_a, team_b, random_seed=12345, log_path="battle_log.json")
     engine.run_battle()
     confrontation_log = engine.get_confrontation_log()
 
-    # Replay battle on console
-    print("===== BATTLE REPLAY =====")
-    replay = BattleReplay(confrontation_log)
-    replay.display_replay()
+    # Replay battle on console (batch runs can skip this)
+    if show_replay:
+        print("===== BATTLE REPLAY =====")
+        replay = BattleReplay(confrontation_log)
+        replay.display_replay()
 
-    # Save battle log and team info to JSON files for scoring
-    with open("battle_log.json", "w") as f:
-        json.dump(confrontation_log, f, indent=4)
-    
     # Save simple team info (only team IDs and formations)
     teams_info = {
         "Team_A": {"formation": team_a.formation},
         "Team_B": {"formation": team_b.formation}
     }
-    with open("teams.json", "w") as f:
-        json.dump(teams_info, f, indent=4)
+    with open("teams.json", "wb") as f:
+        f.write(_dumps(teams_info))
     
     print("Battle simulation complete. Logs saved to 'battle_log.json' and 'teams.json'.")
 
@@ -1,5 +1,267 @@
 import json
-from typing import List, Dict, Any, Optional
+from array import array
+from functools import lru_cache
+from types import FunctionType
+from typing import List, Dict, Any, Optional, Tuple, NamedTuple
+
+import numpy as np
+
+try:
+    import orjson
+except ImportError:  # Fall back to the stdlib decoder.
+    orjson = None  # type: ignore[assignment]
+
+
+def _loads(data: bytes) -> Any:
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+# Shared default for turns without actions or events.
+_EMPTY = ()
+
+# Actors fighting for Team_A; every other actor is scored for Team_B.
+_TEAM_A_ACTORS = frozenset(("A", "B", "C", "D"))
+
+# Rules scored as points per occurrence counted by ScoringEngine._tally, one
+# tuple per count column; rules sharing a predicate share a column.
+_TALLIED_RULES = (
+    ("CRITICAL_HIT_BONUS",), ("ABILITY_USAGE_BONUS",), ("ITEM_USAGE_BONUS",), ("HEALING_EFFICIENCY_BONUS",),
+    ("MULTI_HIT_BONUS",), ("DODGE_BONUS", "EVADE_BONUS"), ("CRITICAL_DEFENSE_BONUS",), ("LUCKY_HIT_BONUS",),
+    ("POWER_SURGE_BONUS",), ("ELEMENTAL_ADVANTAGE_BONUS",), ("SKILL_COMBO_BONUS",), ("PENETRATION_BONUS",),
+    ("ARMOR_BREAK_BONUS",), ("SURPRISE_ATTACK_BONUS",), ("AMBIENT_EFFECT_BONUS",), ("ULTIMATE_MOVE_BONUS",),
+)
+
+# Column of each tallied rule in the (team, rule) count matrix; mirrors _TALLIED_RULES.
+_R_CRITICAL_HIT = 0
+_R_ABILITY_USAGE = 1
+_R_ITEM_USAGE = 2
+_R_HEALING_EFFICIENCY = 3
+_R_MULTI_HIT = 4
+_R_DODGE = 5
+_R_CRITICAL_DEFENSE = 6
+_R_LUCKY_HIT = 7
+_R_POWER_SURGE = 8
+_R_ELEMENTAL_ADVANTAGE = 9
+_R_SKILL_COMBO = 10
+_R_PENETRATION = 11
+_R_ARMOR_BREAK = 12
+_R_SURPRISE_ATTACK = 13
+_R_AMBIENT_EFFECT = 14
+_R_ULTIMATE_MOVE = 15
+_N_TALLIED = 16
+
+
+# Bit flags for the substrings and exact matches an action string is scored on.
+_F_ABILITY = 1
+_F_ITEM = 2
+_F_HEAL = 4
+_F_MISSED = 8
+_F_ATTACK = 16
+_F_FIREBALL = 32
+_F_ULTIMATE = 64
+_F_IDLE = 128
+
+_ACTION_SUBSTRINGS = (
+    ("use ability", _F_ABILITY), ("use item", _F_ITEM), ("Heal", _F_HEAL), ("missed", _F_MISSED),
+    ("attack", _F_ATTACK), ("Fireball", _F_FIREBALL), ("Ultimate", _F_ULTIMATE),
+)
+
+
+@lru_cache(maxsize=None)
+def _action_flags(action: str) -> int:
+    """Categorize an action string into its _F_* bits; logs repeat a handful of strings."""
+    flags = _F_IDLE if action == "idle" else 0
+    for needle, flag in _ACTION_SUBSTRINGS:
+        if needle in action:
+            flags |= flag
+    return flags
+
+
+@lru_cache(maxsize=1024)
+def _is_sorted(formation: Tuple[int, ...]) -> bool:
+    """Whether a formation is in ascending order; tournaments reuse the same lineups."""
+    return list(formation) == sorted(formation)
+
+
+def _column(packed: array) -> np.ndarray:
+    """View a packed array.array column as a NumPy array without copying it."""
+    return np.frombuffer(packed, dtype=packed.typecode)
+
+
+class _LogColumns(NamedTuple):
+    """Struct-of-arrays view of a battle log's actions and critical-hit events."""
+    actor_is_a: np.ndarray  # bool per interned actor id
+    actor: np.ndarray  # int32 actor id per action
+    turn: np.ndarray  # int32 log index of each action's turn
+    turn_number: np.ndarray  # int32 turn_number of each action's turn
+    flags: np.ndarray  # uint8 _F_* bits per action
+    damage: np.ndarray  # int32 damage per attack, 0 otherwise
+    opener: np.ndarray  # int32 first actor id of each turn with actions
+    closer: np.ndarray  # int32 last actor id of each turn with actions
+    crit_a: np.ndarray  # bool per critical-hit event mentioning Team_A
+    crit_b: np.ndarray  # bool per critical-hit event mentioning Team_B
+
+
+class _Formations(NamedTuple):
+    """Formation-derived values shared by the formation strategies."""
+    sorted_a: bool
+    sorted_b: bool
+    sum_a: int
+    sum_b: int
+    len_a: int
+    len_b: int
+
+###############################################################################
+#                           LOG TALLY KERNELS
+###############################################################################
+
+try:
+    import numba
+    from numba import prange
+except ImportError:  # Numba is optional; tallies fall back to NumPy masks.
+    numba = None  # type: ignore[assignment]
+    prange = range  # type: ignore[misc]
+
+
+def _tally_masks(cols: _LogColumns) -> np.ndarray:
+    """Count the tallied rules with one boolean-mask reduction per rule."""
+    counts = np.zeros((2, _N_TALLIED), dtype=np.int64)
+
+    def tally(rule: int, mask: np.ndarray, is_a: np.ndarray) -> None:
+        counts[0, rule] += np.count_nonzero(mask & is_a)
+        counts[1, rule] += np.count_nonzero(mask & ~is_a)
+
+    is_a = cols.actor_is_a[cols.actor]
+    flags = cols.flags
+    attack = (flags & _F_ATTACK) != 0
+    damage = cols.damage
+    tally(_R_ABILITY_USAGE, (flags & _F_ABILITY) != 0, is_a)
+    tally(_R_ITEM_USAGE, (flags & _F_ITEM) != 0, is_a)
+    tally(_R_HEALING_EFFICIENCY, (flags & _F_HEAL) != 0, is_a)
+    tally(_R_DODGE, (flags & _F_MISSED) != 0, is_a)
+    # One damage histogram per team answers every threshold rule: hits above the
+    # top threshold are clipped into its bin and counts are read from the tail.
+    for team, team_mask in enumerate((is_a, ~is_a)):
+        hits = np.bincount(np.clip(damage[attack & team_mask], 0, 20), minlength=21)
+        counts[team, _R_LUCKY_HIT] += hits[1]
+        counts[team, _R_PENETRATION] += hits[10:].sum()
+        counts[team, _R_POWER_SURGE] += hits[15:].sum()
+        counts[team, _R_ARMOR_BREAK] += hits[20]
+    tally(_R_ELEMENTAL_ADVANTAGE, (flags & _F_FIREBALL) != 0, is_a)
+    tally(_R_ULTIMATE_MOVE, (flags & _F_ULTIMATE) != 0, is_a)
+    tally(_R_AMBIENT_EFFECT, (flags & _F_IDLE) != 0, is_a)
+    # Acting in consecutive turns is a skill combo; a stable sort keeps each
+    # actor's actions in log order so neighbours are successive actions.
+    order = np.argsort(cols.actor, kind="stable")
+    actor_sorted = cols.actor[order]
+    turn_number_sorted = cols.turn_number[order]
+    combo = (actor_sorted[1:] == actor_sorted[:-1]) & (turn_number_sorted[1:] - turn_number_sorted[:-1] == 1)
+    tally(_R_SKILL_COMBO, combo, is_a[order][1:])
+    # An actor appearing more than once in a turn scores a multi-hit.
+    n_actors = max(len(cols.actor_is_a), 1)
+    keys, per_turn = np.unique(cols.turn.astype(np.int64) * n_actors + cols.actor, return_counts=True)
+    repeated = keys[per_turn > 1] % n_actors
+    tally(_R_MULTI_HIT, np.ones(len(repeated), dtype=np.bool_), cols.actor_is_a[repeated])
+    # A turn opened by someone other than the previous turn's closer is a surprise.
+    surprise = cols.opener[1:] != cols.closer[:-1]
+    tally(_R_SURPRISE_ATTACK, surprise, cols.actor_is_a[cols.opener[1:]])
+    # Critical hits mentioning Team_A score for A's offence and defence; a
+    # Team_B mention scores B's offence, and its defence only without Team_A.
+    crit_a, crit_b = cols.crit_a, cols.crit_b
+    counts[0, _R_CRITICAL_HIT] = np.count_nonzero(crit_a)
+    counts[0, _R_CRITICAL_DEFENSE] = np.count_nonzero(crit_a)
+    counts[1, _R_CRITICAL_HIT] = np.count_nonzero(crit_b)
+    counts[1, _R_CRITICAL_DEFENSE] = np.count_nonzero(crit_b & ~crit_a)
+    return counts
+
+
+# Actions per parallel chunk of the kernel; small logs run as a single chunk.
+_KERNEL_CHUNK = 1 << 16
+
+# Last turn number of an actor who has not acted yet; far below any int32 turn
+# number, so it can never look like the previous turn.
+_NEVER_ACTED = -(1 << 40)
+
+
+def _tally_kernel(actor_is_a, actor, turn, turn_number, flags, damage, opener, closer, crit_a, crit_b):
+    """Count the tallied rules over the log columns, per-action rules in parallel chunks."""
+    n = len(actor)
+    n_chunks = (n + _KERNEL_CHUNK - 1) // _KERNEL_CHUNK
+    # Each chunk fills its own count matrix, so the parallel loop shares no writes.
+    partial = np.zeros((n_chunks, 2, _N_TALLIED), dtype=np.int64)
+    for c in prange(n_chunks):
+        chunk_counts = partial[c]
+        for i in range(c * _KERNEL_CHUNK, min(n, (c + 1) * _KERNEL_CHUNK)):
+            team = 0 if actor_is_a[actor[i]] else 1
+            f = flags[i]
+            if f & _F_ABILITY:
+                chunk_counts[team, _R_ABILITY_USAGE] += 1
+            if f & _F_ITEM:
+                chunk_counts[team, _R_ITEM_USAGE] += 1
+            if f & _F_HEAL:
+                chunk_counts[team, _R_HEALING_EFFICIENCY] += 1
+            if f & _F_MISSED:
+                chunk_counts[team, _R_DODGE] += 1
+            if f & _F_ATTACK:
+                # Thresholds nest, so each hit stops at the first one it misses.
+                d = damage[i]
+                if d >= 10:
+                    chunk_counts[team, _R_PENETRATION] += 1
+                    if d >= 15:
+                        chunk_counts[team, _R_POWER_SURGE] += 1
+                        if d >= 20:
+                            chunk_counts[team, _R_ARMOR_BREAK] += 1
+                elif d == 1:
+                    chunk_counts[team, _R_LUCKY_HIT] += 1
+            if f & _F_FIREBALL:
+                chunk_counts[team, _R_ELEMENTAL_ADVANTAGE] += 1
+            if f & _F_ULTIMATE:
+                chunk_counts[team, _R_ULTIMATE_MOVE] += 1
+            if f & _F_IDLE:
+                chunk_counts[team, _R_AMBIENT_EFFECT] += 1
+    counts = partial.sum(axis=0)
+    # Combos and multi-hits depend on each actor's previous action, so they stay serial.
+    n_actors = len(actor_is_a)
+    last_turn_number = np.full(n_actors, _NEVER_ACTED, dtype=np.int64)
+    hit_turn = np.full(n_actors, -1, dtype=np.int64)
+    hits = np.zeros(n_actors, dtype=np.int64)
+    for i in range(n):
+        a = actor[i]
+        team = 0 if actor_is_a[a] else 1
+        # Acting in consecutive turns is a skill combo.
+        if turn_number[i] - last_turn_number[a] == 1:
+            counts[team, _R_SKILL_COMBO] += 1
+        last_turn_number[a] = turn_number[i]
+        # The second action by the same actor within a turn scores its multi-hit.
+        if hit_turn[a] == turn[i]:
+            hits[a] += 1
+            if hits[a] == 2:
+                counts[team, _R_MULTI_HIT] += 1
+        else:
+            hit_turn[a] = turn[i]
+            hits[a] = 1
+    # A turn opened by someone other than the previous turn's closer is a surprise.
+    for t in range(1, len(opener)):
+        if opener[t] != closer[t - 1]:
+            counts[0 if actor_is_a[opener[t]] else 1, _R_SURPRISE_ATTACK] += 1
+    for e in range(len(crit_a)):
+        if crit_a[e]:
+            counts[0, _R_CRITICAL_HIT] += 1
+            counts[0, _R_CRITICAL_DEFENSE] += 1
+            if crit_b[e]:
+                counts[1, _R_CRITICAL_HIT] += 1
+        elif crit_b[e]:
+            counts[1, _R_CRITICAL_HIT] += 1
+            counts[1, _R_CRITICAL_DEFENSE] += 1
+    return counts
+
+
+# A mypyc-compiled build turns the kernel into native code numba cannot JIT;
+# that build tallies with the NumPy masks instead.
+_JIT_KERNEL = numba is not None and isinstance(_tally_kernel, FunctionType)
+if _JIT_KERNEL:
+    _tally_kernel = numba.njit(parallel=True, cache=True)(_tally_kernel)
 
 ###############################################################################
 #                        STRATEGY LIBRARY CLASS
@@ -56,317 +318,189 @@ class ScoringEngine:
     def __init__(self, strategy_library: StrategyLibrary):
         self.strategy_library = strategy_library
         self.rules = strategy_library.get_rules()
-
-    def score_battle(self, log: List[Dict[str, Any]], team_info: Dict[str, Any]) -> Dict[str, int]:
-        score_a = 0
-        score_b = 0
-        # List of strategy functions to apply:
-        strategies = [
+        # Point values keyed by rule name, so strategies skip the nested rule dicts.
+        self._pts = {name: rule["points"] for name, rule in self.rules.items()}
+        self._tallied_pts = np.array(
+            [sum(self._pts[name] for name in names) for names in _TALLIED_RULES], dtype=np.int64
+        )
+        # Bonuses every battle earns for both teams regardless of log or formation
+        # (counter attack and counter move are not implemented and score nothing).
+        self._const_bonus = (
+            self._pts["DEFENSE_SURVIVAL_BONUS"]
+            + self._pts["TEAMWORK_BONUS"]
+            + self._pts["RESOURCE_MANAGEMENT_BONUS"]
+            + self._pts["TACTICAL_RETREAT_BONUS"]
+        )
+        # Strategy functions to apply, bound once per engine.
+        self._strategies = (
+            self._apply_time_critical_bonus,
+            self._apply_strategic_overtake_bonus
+        )
+        self._formation_strategies = (
             self._apply_position_bonus,
-            self._apply_fast_attack_bonus,
-            self._apply_critical_hit_bonus,
-            self._apply_ability_usage_bonus,
-            self._apply_item_usage_bonus,
-            self._apply_first_strike_bonus,
             self._apply_last_stand_bonus,
-            self._apply_healing_efficiency_bonus,
-            self._apply_defense_survival_bonus,
-            self._apply_teamwork_bonus,
-            self._apply_multi_hit_bonus,
-            self._apply_dodge_bonus,
-            self._apply_counter_attack_bonus,
             self._apply_flexible_position_bonus,
-            self._apply_critical_defense_bonus,
             self._apply_speed_advantage_bonus,
-            self._apply_lucky_hit_bonus,
-            self._apply_power_surge_bonus,
-            self._apply_elemental_advantage_bonus,
-            self._apply_skill_combo_bonus,
-            self._apply_penetration_bonus,
-            self._apply_armor_break_bonus,
-            self._apply_surprise_attack_bonus,
-            self._apply_evade_bonus,
-            self._apply_counter_move_bonus,
-            self._apply_floor_advantage_bonus,
-            self._apply_ambient_effect_bonus,
-            self._apply_positioning_advantage_bonus,
-            self._apply_morale_boost_bonus,
-            self._apply_tactical_retreat_bonus,
-            self._apply_resource_management_bonus,
-            self._apply_time_critical_bonus,
-            self._apply_strategic_overtake_bonus,
-            self._apply_ultimate_move_bonus,
-            self._apply_adaptive_strategy_bonus
-        ]
-        for func in strategies:
+            self._apply_morale_boost_bonus
+        )
+        if _JIT_KERNEL:
+            # Compile (or load the cached) kernel now rather than inside the first score_battle.
+            _tally_kernel(*self._vectorize_log([]))
+
+    def score_battle(self, log: List[Dict[str, Any]], team_info: Dict[str, Any]) -> Dict[str, int]:
+        score_a = self._const_bonus
+        score_b = self._const_bonus
+        for func in self._strategies:
             a, b = func(log, team_info)
             score_a += a
             score_b += b
+        # Formation strategies share values computed once per battle.
+        formations = self._formations(team_info)
+        for formation_func in self._formation_strategies:
+            a, b = formation_func(formations)
+            score_a += a
+            score_b += b
+        if not log:
+            # Nothing to encode or tally; only the formation and constant bonuses apply.
+            return {"Team_A": score_a, "Team_B": score_b}
+        # Everything that reads actions or events comes from one pass over the log.
+        cols = self._vectorize_log(log)
+        a, b = self._apply_first_strike_bonus(cols)
+        score_a += a
+        score_b += b
+        scores = self._tally(cols) @ self._tallied_pts
+        score_a += int(scores[0])
+        score_b += int(scores[1])
         return {"Team_A": score_a, "Team_B": score_b}
 
-    # Each strategy function examines the battle log and/or team info.
-    def _apply_position_bonus(self, log: List[Dict[str, Any]], team_info: Dict[str, Any]) -> (int, int):
-        rule = self.rules.get("POSITION_BONUS")
-        bonus_a = rule["points"] if team_info["Team_A"]["formation"] == sorted(team_info["Team_A"]["formation"]) else 0
-        bonus_b = rule["points"] if team_info["Team_B"]["formation"] == sorted(team_info["Team_B"]["formation"]) else 0
-        return bonus_a, bonus_b
-
-    def _apply_fast_attack_bonus(self, log: List[Dict[str, Any]], team_info: Dict[str, Any]) -> (int, int):
-        rule = self.rules.get("FAST_ATTACK_BONUS")
-        bonus_a = 0
-        bonus_b = 0
-        if log and "actions" in log[0]:
-            first_action = log[0]["actions"][0]
-            actor = first_action["actor"]
-            # Assume Team_A if actor starts with A, else Team_B (for demonstration)
-            if actor in ["A", "B", "C", "D"]:
-                bonus_a += rule["points"]
-            else:
-                bonus_b += rule["points"]
-        return bonus_a, bonus_b
-
-    def _apply_critical_hit_bonus(self, log: List[Dict[str, Any]], team_info: Dict[str, Any]) -> (int, int):
-        rule = self.rules.get("CRITICAL_HIT_BONUS")
-        bonus_a = sum(rule["points"] for turn in log for ev in turn.get("events", []) if "Critical hit" in ev and "Team_A" in ev)
-        bonus_b = sum(rule["points"] for turn in log for ev in turn.get("events", []) if "Critical hit" in ev and "Team_B" in ev)
-        return bonus_a, bonus_b
-
-    def _apply_ability_usage_bonus(self, log: List[Dict[str, Any]], team_info: Dict[str, Any]) -> (int, int):
-        rule = self.rules.get("ABILITY_USAGE_BONUS")
-        bonus_a = sum(rule["points"] for turn in log for action in turn.get("actions", []) if "use ability" in action["action"] and action["actor"] in ["A", "B", "C", "D"])
-        bonus_b = sum(rule["points"] for turn in log for action in turn.get("actions", []) if "use ability" in action["action"] and action["actor"] not in ["A", "B", "C", "D"])
-        return bonus_a, bonus_b
-
-    def _apply_item_usage_bonus(self, log: List[Dict[str, Any]], team_info: Dict[str, Any]) -> (int, int):
-        rule = self.rules.get("ITEM_USAGE_BONUS")
-        bonus_a = sum(rule["points"] for turn in log for action in turn.get("actions", []) if "use item" in action["action"] and action["actor"] in ["A", "B", "C", "D"])
-        bonus_b = sum(rule["points"] for turn in log for action in turn.get("actions", []) if "use item" in action["action"] and action["actor"] not in ["A", "B", "C", "D"])
-        return bonus_a, bonus_b
-
-    def _apply_first_strike_bonus(self, log: List[Dict[str, Any]], team_info: Dict[str, Any]) -> (int, int):
-        rule = self.rules.get("FIRST_STRIKE_BONUS")
-        bonus_a = bonus_b = 0
-        if log and log[0].get("actions", []):
-            actor = log[0]["actions"][0]["actor"]
-            if actor in ["A", "B", "C", "D"]:
-                bonus_a += rule["points"]
-            else:
-                bonus_b += rule["points"]
-        return bonus_a, bonus_b
+    @staticmethod
+    def _formations(team_info: Dict[str, Any]) -> _Formations:
+        formation_a = team_info["Team_A"]["formation"]
+        formation_b = team_info["Team_B"]["formation"]
+        return _Formations(
+            sorted_a=_is_sorted(tuple(formation_a)),
+            sorted_b=_is_sorted(tuple(formation_b)),
+            sum_a=sum(formation_a),
+            sum_b=sum(formation_b),
+            len_a=len(formation_a),
+            len_b=len(formation_b),
+        )
+
+    @staticmethod
+    def _vectorize_log(log: List[Dict[str, Any]]) -> _LogColumns:
+        """Walk the log once and lay its actions and critical-hit events out as columns."""
+        actor_ids: Dict[str, int] = {}
+        # Columns are packed as they are read, 4 bytes per int instead of a boxed object.
+        actor_col = array("i")
+        turn_col = array("i")
+        turn_number_col = array("i")
+        flags_col = array("B")
+        damage_col = array("i")
+        openers = array("i")
+        closers = array("i")
+        crit_a = array("B")
+        crit_b = array("B")
+        for index, turn in enumerate(log):
+            actions = turn.get("actions", _EMPTY)
+            for action in actions:
+                actor_id = actor_ids.setdefault(action["actor"], len(actor_ids))
+                flags = _action_flags(action["action"])
+                actor_col.append(actor_id)
+                turn_col.append(index)
+                turn_number_col.append(turn["turn_number"])
+                flags_col.append(flags)
+                damage_col.append(action["damage"] if flags & _F_ATTACK else 0)
+            if actions:
+                openers.append(actor_col[-len(actions)])
+                closers.append(actor_col[-1])
+            for ev in turn.get("events", _EMPTY):
+                if "Critical hit" in ev:
+                    crit_a.append("Team_A" in ev)
+                    crit_b.append("Team_B" in ev)
+        actor_is_a = np.array([actor in _TEAM_A_ACTORS for actor in actor_ids], dtype=np.bool_)
+        return _LogColumns(
+            actor_is_a=actor_is_a,
+            actor=_column(actor_col),
+            turn=_column(turn_col),
+            turn_number=_column(turn_number_col),
+            flags=_column(flags_col),
+            damage=_column(damage_col),
+            opener=_column(openers),
+            closer=_column(closers),
+            crit_a=_column(crit_a).view(np.bool_),
+            crit_b=_column(crit_b).view(np.bool_),
+        )
+
+    @staticmethod
+    def _tally(cols: _LogColumns) -> np.ndarray:
+        """Count every per-action and per-event rule as a (team, rule) matrix, row 0 being Team_A."""
+        if not _JIT_KERNEL:
+            return _tally_masks(cols)
+        return _tally_kernel(*cols)
 
-    def _apply_last_stand_bonus(self, log: List[Dict[str, Any]], team_info: Dict[str, Any]) -> (int, int):
-        rule = self.rules.get("LAST_STAND_BONUS")
+    # Each strategy function examines the battle log and/or team info.
+    def _apply_position_bonus(self, formations: _Formations) -> Tuple[int, int]:
+        # A sorted formation also earns the positioning advantage.
+        points = self._pts["POSITION_BONUS"] + self._pts["POSITIONING_ADVANTAGE_BONUS"]
+        bonus_a = points if formations.sorted_a else 0
+        bonus_b = points if formations.sorted_b else 0
+        return bonus_a, bonus_b
+
+    def _apply_first_strike_bonus(self, cols: _LogColumns) -> Tuple[int, int]:
+        # Striking first is also a fast attack.
+        points = self._pts["FAST_ATTACK_BONUS"] + self._pts["FIRST_STRIKE_BONUS"]
+        # Only an action in the log's first turn counts as the opening strike.
+        if not len(cols.actor) or cols.turn[0] != 0:
+            return 0, 0
+        if cols.actor_is_a[cols.actor[0]]:
+            return points, 0
+        return 0, points
+
+    def _apply_last_stand_bonus(self, formations: _Formations) -> Tuple[int, int]:
+        points = self._pts["LAST_STAND_BONUS"]
         # If a team has exactly one champion remaining (simulated here via formation length of 1)
-        bonus_a = rule["points"] if len(team_info["Team_A"]["formation"]) == 1 else 0
-        bonus_b = rule["points"] if len(team_info["Team_B"]["formation"]) == 1 else 0
-        return bonus_a, bonus_b
-
-    def _apply_healing_efficiency_bonus(self, log: List[Dict[str, Any]], team_info: Dict[str, Any]) -> (int, int):
-        rule = self.rules.get("HEALING_EFFICIENCY_BONUS")
-        bonus_a = sum(rule["points"] for turn in log for action in turn.get("actions", []) if "Heal" in action["action"] and action["actor"] in ["A", "B", "C", "D"])
-        bonus_b = sum(rule["points"] for turn in log for action in turn.get("actions", []) if "Heal" in action["action"] and action["actor"] not in ["A", "B", "C", "D"])
-        return bonus_a, bonus_b
-
-    def _apply_defense_survival_bonus(self, log: List[Dict[str, Any]], team_info: Dict[str, Any]) -> (int, int):
-        rule = self.rules.get("DEFENSE_SURVIVAL_BONUS")
-        bonus_a = rule["points"]  # Dummy value for demonstration
-        bonus_b = rule["points"]
-        return bonus_a, bonus_b
-
-    def _apply_teamwork_bonus(self, log: List[Dict[str, Any]], team_info: Dict[str, Any]) -> (int, int):
-        rule = self.rules.get("TEAMWORK_BONUS")
-        bonus_a = rule["points"]
-        bonus_b = rule["points"]
-        return bonus_a, bonus_b
-
-    def _apply_multi_hit_bonus(self, log: List[Dict[str, Any]], team_info: Dict[str, Any]) -> (int, int):
-        rule = self.rules.get("MULTI_HIT_BONUS")
-        bonus_a = bonus_b = 0
-        for turn in log:
-            counts = {}
-            for action in turn.get("actions", []):
-                actor = action["actor"]
-                counts[actor] = counts.get(actor, 0) + 1
-            for actor, count in counts.items():
-                if count > 1:
-                    if actor in ["A", "B", "C", "D"]:
-                        bonus_a += rule["points"]
-                    else:
-                        bonus_b += rule["points"]
-        return bonus_a, bonus_b
-
-    def _apply_dodge_bonus(self, log: List[Dict[str, Any]], team_info: Dict[str, Any]) -> (int, int):
-        rule = self.rules.get("DODGE_BONUS")
-        bonus_a = sum(rule["points"] for turn in log for action in turn.get("actions", []) if "missed" in action["action"] and action["actor"] in ["A", "B", "C", "D"])
-        bonus_b = sum(rule["points"] for turn in log for action in turn.get("actions", []) if "missed" in action["action"] and action["actor"] not in ["A", "B", "C", "D"])
-        return bonus_a, bonus_b
-
-    def _apply_counter_attack_bonus(self, log: List[Dict[str, Any]], team_info: Dict[str, Any]) -> (int, int):
-        # For simplicity, no counter attack bonus implemented.
-        return 0, 0
-
-    def _apply_flexible_position_bonus(self, log: List[Dict[str, Any]], team_info: Dict[str, Any]) -> (int, int):
-        rule = self.rules.get("FLEXIBLE_POSITION_BONUS")
-        bonus_a = rule["points"] if team_info["Team_A"]["formation"] != sorted(team_info["Team_A"]["formation"]) else 0
-        bonus_b = rule["points"] if team_info["Team_B"]["formation"] != sorted(team_info["Team_B"]["formation"]) else 0
-        return bonus_a, bonus_b
-
-    def _apply_critical_defense_bonus(self, log: List[Dict[str, Any]], team_info: Dict[str, Any]) -> (int, int):
-        rule = self.rules.get("CRITICAL_DEFENSE_BONUS")
-        bonus_a = bonus_b = 0
-        for turn in log:
-            for ev in turn.get("events", []):
-                if "Critical hit" in ev and "Team_A" in ev:
-                    bonus_a += rule["points"]
-                elif "Critical hit" in ev and "Team_B" in ev:
-                    bonus_b += rule["points"]
-        return bonus_a, bonus_b
-
-    def _apply_speed_advantage_bonus(self, log: List[Dict[str, Any]], team_info: Dict[str, Any]) -> (int, int):
-        rule = self.rules.get("SPEED_ADVANTAGE_BONUS")
-        # Dummy: assign bonus based on formation sum (lower sum means higher speed)
-        bonus_a = rule["points"] if sum(team_info["Team_A"]["formation"]) < sum(team_info["Team_B"]["formation"]) else 0
-        bonus_b = rule["points"] if sum(team_info["Team_B"]["formation"]) < sum(team_info["Team_A"]["formation"]) else 0
-        return bonus_a, bonus_b
-
-    def _apply_lucky_hit_bonus(self, log: List[Dict[str, Any]], team_info: Dict[str, Any]) -> (int, int):
-        rule = self.rules.get("LUCKY_HIT_BONUS")
-        bonus_a = sum(rule["points"] for turn in log for action in turn.get("actions", []) if "attack" in action["action"] and action["damage"] == 1 and action["actor"] in ["A", "B", "C", "D"])
-        bonus_b = sum(rule["points"] for turn in log for action in turn.get("actions", []) if "attack" in action["action"] and action["damage"] == 1 and action["actor"] not in ["A", "B", "C", "D"])
-        return bonus_a, bonus_b
-
-    def _apply_power_surge_bonus(self, log: List[Dict[str, Any]], team_info: Dict[str, Any]) -> (int, int):
-        rule = self.rules.get("POWER_SURGE_BONUS")
-        bonus_a = sum(rule["points"] for turn in log for action in turn.get("actions", []) if "attack" in action["action"] and action["damage"] >= 15 and action["actor"] in ["A", "B", "C", "D"])
-        bonus_b = sum(rule["points"] for turn in log for action in turn.get("actions", []) if "attack" in action["action"] and action["damage"] >= 15 and action["actor"] not in ["A", "B", "C", "D"])
-        return bonus_a, bonus_b
-
-    def _apply_elemental_advantage_bonus(self, log: List[Dict[str, Any]], team_info: Dict[str, Any]) -> (int, int):
-        rule = self.rules.get("ELEMENTAL_ADVANTAGE_BONUS")
-        # Dummy: check if "Fireball" is used
-        bonus_a = sum(rule["points"] for turn in log for action in turn.get("actions", []) if "Fireball" in action["action"] and action["actor"] in ["A", "B", "C", "D"])
-        bonus_b = sum(rule["points"] for turn in log for action in turn.get("actions", []) if "Fireball" in action["action"] and action["actor"] not in ["A", "B", "C", "D"])
-        return bonus_a, bonus_b
-
-    def _apply_skill_combo_bonus(self, log: List[Dict[str, Any]], team_info: Dict[str, Any]) -> (int, int):
-        rule = self.rules.get("SKILL_COMBO_BONUS")
-        bonus_a = bonus_b = 0
-        last_turn = {}
-        for turn in log:
-            for action in turn.get("actions", []):
-                actor = action["actor"]
-                if actor in last_turn and turn["turn_number"] - last_turn[actor] == 1:
-                    if actor in ["A", "B", "C", "D"]:
-                        bonus_a += rule["points"]
-                    else:
-                        bonus_b += rule["points"]
-                last_turn[actor] = turn["turn_number"]
-        return bonus_a, bonus_b
-
-    def _apply_penetration_bonus(self, log: List[Dict[str, Any]], team_info: Dict[str, Any]) -> (int, int):
-        rule = self.rules.get("PENETRATION_BONUS")
-        bonus_a = sum(rule["points"] for turn in log for action in turn.get("actions", []) if "attack" in action["action"] and action["damage"] >= 10 and action["actor"] in ["A", "B", "C", "D"])
-        bonus_b = sum(rule["points"] for turn in log for action in turn.get("actions", []) if "attack" in action["action"] and action["damage"] >= 10 and action["actor"] not in ["A", "B", "C", "D"])
+        bonus_a = points if formations.len_a == 1 else 0
+        bonus_b = points if formations.len_b == 1 else 0
         return bonus_a, bonus_b
 
-    def _apply_armor_break_bonus(self, log: List[Dict[str, Any]], team_info: Dict[str, Any]) -> (int, int):
-        rule = self.rules.get("ARMOR_BREAK_BONUS")
-        bonus_a = sum(rule["points"] for turn in log for action in turn.get("actions", []) if "attack" in action["action"] and action["damage"] >= 20 and action["actor"] in ["A", "B", "C", "D"])
-        bonus_b = sum(rule["points"] for turn in log for action in turn.get("actions", []) if "attack" in action["action"] and action["damage"] >= 20 and action["actor"] not in ["A", "B", "C", "D"])
+    def _apply_flexible_position_bonus(self, formations: _Formations) -> Tuple[int, int]:
+        # An unsorted formation also earns the adaptive strategy bonus.
+        points = self._pts["FLEXIBLE_POSITION_BONUS"] + self._pts["ADAPTIVE_STRATEGY_BONUS"]
+        bonus_a = points if not formations.sorted_a else 0
+        bonus_b = points if not formations.sorted_b else 0
         return bonus_a, bonus_b
 
-    def _apply_surprise_attack_bonus(self, log: List[Dict[str, Any]], team_info: Dict[str, Any]) -> (int, int):
-        rule = self.rules.get("SURPRISE_ATTACK_BONUS")
-        bonus_a = bonus_b = 0
-        last_actor = None
-        for turn in log:
-            if turn.get("actions", []):
-                first_actor = turn["actions"][0]["actor"]
-                if last_actor and first_actor != last_actor:
-                    if first_actor in ["A", "B", "C", "D"]:
-                        bonus_a += rule["points"]
-                    else:
-                        bonus_b += rule["points"]
-                last_actor = turn["actions"][-1]["actor"]
-        return bonus_a, bonus_b
-
-    def _apply_evade_bonus(self, log: List[Dict[str, Any]], team_info: Dict[str, Any]) -> (int, int):
-        rule = self.rules.get("EVADE_BONUS")
-        bonus_a = sum(rule["points"] for turn in log for action in turn.get("actions", []) if "missed" in action["action"] and action["actor"] in ["A", "B", "C", "D"])
-        bonus_b = sum(rule["points"] for turn in log for action in turn.get("actions", []) if "missed" in action["action"] and action["actor"] not in ["A", "B", "C", "D"])
-        return bonus_a, bonus_b
-
-    def _apply_counter_move_bonus(self, log: List[Dict[str, Any]], team_info: Dict[str, Any]) -> (int, int):
-        return 0, 0
-
-    def _apply_floor_advantage_bonus(self, log: List[Dict[str, Any]], team_info: Dict[str, Any]) -> (int, int):
-        rule = self.rules.get("FLOOR_ADVANTAGE_BONUS")
-        sum_a = sum(team_info["Team_A"]["formation"])
-        sum_b = sum(team_info["Team_B"]["formation"])
-        bonus_a = rule["points"] if sum_a < sum_b else 0
-        bonus_b = rule["points"] if sum_b < sum_a else 0
+    def _apply_speed_advantage_bonus(self, formations: _Formations) -> Tuple[int, int]:
+        # Dummy: assign bonus based on formation sum (lower sum means higher speed);
+        # the floor advantage is awarded on the same comparison.
+        points = self._pts["SPEED_ADVANTAGE_BONUS"] + self._pts["FLOOR_ADVANTAGE_BONUS"]
+        bonus_a = points if formations.sum_a < formations.sum_b else 0
+        bonus_b = points if formations.sum_b < formations.sum_a else 0
         return bonus_a, bonus_b
 
-    def _apply_ambient_effect_bonus(self, log: List[Dict[str, Any]], team_info: Dict[str, Any]) -> (int, int):
-        rule = self.rules.get("AMBIENT_EFFECT_BONUS")
-        bonus_a = sum(rule["points"] for turn in log for action in turn.get("actions", []) if action["action"] == "idle" and action["actor"] in ["A", "B", "C", "D"])
-        bonus_b = sum(rule["points"] for turn in log for action in turn.get("actions", []) if action["action"] == "idle" and action["actor"] not in ["A", "B", "C", "D"])
-        return bonus_a, bonus_b
-
-    def _apply_positioning_advantage_bonus(self, log: List[Dict[str, Any]], team_info: Dict[str, Any]) -> (int, int):
-        rule = self.rules.get("POSITIONING_ADVANTAGE_BONUS")
-        bonus_a = rule["points"] if team_info["Team_A"]["formation"] == sorted(team_info["Team_A"]["formation"]) else 0
-        bonus_b = rule["points"] if team_info["Team_B"]["formation"] == sorted(team_info["Team_B"]["formation"]) else 0
-        return bonus_a, bonus_b
-
-    def _apply_morale_boost_bonus(self, log: List[Dict[str, Any]], team_info: Dict[str, Any]) -> (int, int):
-        rule = self.rules.get("MORALE_BOOST_BONUS")
+    def _apply_morale_boost_bonus(self, formations: _Formations) -> Tuple[int, int]:
+        points = self._pts["MORALE_BOOST_BONUS"]
         # Dummy: difference in formation sum as a proxy for morale
-        diff = abs(sum(team_info["Team_A"]["formation"]) - sum(team_info["Team_B"]["formation"]))
-        bonus_a = rule["points"] * diff
-        bonus_b = rule["points"] * diff
-        return bonus_a, bonus_b
-
-    def _apply_tactical_retreat_bonus(self, log: List[Dict[str, Any]], team_info: Dict[str, Any]) -> (int, int):
-        rule = self.rules.get("TACTICAL_RETREAT_BONUS")
-        bonus_a = rule["points"] if len(team_info["Team_A"]["formation"]) == len(team_info["Team_A"]["formation"]) else 0
-        bonus_b = rule["points"] if len(team_info["Team_B"]["formation"]) == len(team_info["Team_B"]["formation"]) else 0
-        return bonus_a, bonus_b
-
-    def _apply_resource_management_bonus(self, log: List[Dict[str, Any]], team_info: Dict[str, Any]) -> (int, int):
-        rule = self.rules.get("RESOURCE_MANAGEMENT_BONUS")
-        # Dummy: always award bonus if formation exists
-        bonus_a = rule["points"]
-        bonus_b = rule["points"]
+        diff = abs(formations.sum_a - formations.sum_b)
+        bonus_a = points * diff
+        bonus_b = points * diff
         return bonus_a, bonus_b
 
-    def _apply_time_critical_bonus(self, log: List[Dict[str, Any]], team_info: Dict[str, Any]) -> (int, int):
-        rule = self.rules.get("TIME_CRITICAL_BONUS")
+    def _apply_time_critical_bonus(self, log: List[Dict[str, Any]], team_info: Dict[str, Any]) -> Tuple[int, int]:
+        points = self._pts["TIME_CRITICAL_BONUS"]
         if log and log[-1].get("final_turn", 100) < 10:
-            return rule["points"], rule["points"]
+            return points, points
         return 0, 0
 
-    def _apply_strategic_overtake_bonus(self, log: List[Dict[str, Any]], team_info: Dict[str, Any]) -> (int, int):
-        rule = self.rules.get("STRATEGIC_OVERTAKE_BONUS")
+    def _apply_strategic_overtake_bonus(self, log: List[Dict[str, Any]], team_info: Dict[str, Any]) -> Tuple[int, int]:
+        points = self._pts["STRATEGIC_OVERTAKE_BONUS"]
         bonus_a = bonus_b = 0
         if log and "battle_result" in log[-1]:
             result = log[-1]["battle_result"]
             if "Team_A" in result:
-                bonus_a += rule["points"]
+                bonus_a += points
             elif "Team_B" in result:
-                bonus_b += rule["points"]
-        return bonus_a, bonus_b
-
-    def _apply_ultimate_move_bonus(self, log: List[Dict[str, Any]], team_info: Dict[str, Any]) -> (int, int):
-        rule = self.rules.get("ULTIMATE_MOVE_BONUS")
-        bonus_a = sum(rule["points"] for turn in log for action in turn.get("actions", []) if "Ultimate" in action["action"] and action["actor"] in ["A", "B", "C", "D"])
-        bonus_b = sum(rule["points"] for turn in log for action in turn.get("actions", []) if "Ultimate" in action["action"] and action["actor"] not in ["A", "B", "C", "D"])
-        return bonus_a, bonus_b
-
-    def _apply_adaptive_strategy_bonus(self, log: List[Dict[str, Any]], team_info: Dict[str, Any]) -> (int, int):
-        rule = self.rules.get("ADAPTIVE_STRATEGY_BONUS")
-        bonus_a = rule["points"] if team_info["Team_A"]["formation"] != sorted(team_info["Team_A"]["formation"]) else 0
-        bonus_b = rule["points"] if team_info["Team_B"]["formation"] != sorted(team_info["Team_B"]["formation"]) else 0
+                bonus_b += points
         return bonus_a, bonus_b
 
 ###############################################################################
@@ -375,10 +509,10 @@ class ScoringEngine:
 
 def main():
     # Load battle log and team configuration produced by game.py
-    with open("battle_log.json", "r") as f:
-        battle_log = json.load(f)
-    with open("teams.json", "r") as f:
-        teams_info = json.load(f)
+    with open("battle_log.json", "rb") as f:
+        battle_log = _loads(f.read())
+    with open("teams.json", "rb") as f:
+        teams_info = _loads(f.read())
 
     # Initialize strategy library and scoring engine
     strategy_lib = StrategyLibrary()